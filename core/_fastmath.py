@@ -0,0 +1,33 @@
+"""
+Small numeric kernels used on every calculation run.
+They are compiled with Numba when it is installed and run as plain Python otherwise.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+@njit(cache=True)
+def utm_epsg_from_lonlat(lon, lat):
+    """Returns the EPSG code of the WGS84 UTM zone containing the given point (326xx north, 327xx south)."""
+    utm_zone = int((lon + 180.0) / 6.0) + 1
+    if lat >= 0.0:
+        return 32600 + utm_zone
+    return 32700 + utm_zone
+
+@njit(cache=True)
+def rect_sides(coords):
+    """Returns the lengths of the first two sides of a rectangle, given its corner coordinates as an (N, 2) array, as a length-2 array."""
+    deltas = coords[1:3] - coords[0:2]
+    return np.hypot(deltas[:, 0], deltas[:, 1])
+
+def warm_up_kernels():
+    """Calls each kernel once so that Numba compiles (or loads from cache) before the first user calculation."""
+    utm_epsg_from_lonlat(0.0, 0.0)
+    rect_sides(np.zeros((5, 2), dtype=np.float64))
@@ -0,0 +1,39 @@
+"""
+Cached pyproj transformers for reprojecting GeoPandas data.
+Building a Transformer is the expensive part of a reprojection, so one is built per CRS pair and reused.
+"""
+from functools import lru_cache
+import numpy as np
+import shapely
+import geopandas as gpd
+from pyproj import CRS, Transformer
+
+@lru_cache(maxsize=32)
+def _cached_transformer(src_wkt, dst_wkt):
+    """Builds a Transformer between two CRS given as WKT strings, memoized on the WKT pair."""
+    return Transformer.from_crs(src_wkt, dst_wkt, always_xy=True)
+
+def get_transformer(src_crs, dst_crs):
+    """Returns the cached always_xy Transformer from src_crs to dst_crs (anything pyproj.CRS accepts)."""
+    return _cached_transformer(CRS(src_crs).to_wkt(), CRS(dst_crs).to_wkt())
+
+def transform_geoseries(geoms, src_crs, dst_crs):
+    """
+    Reprojects a GeoSeries by passing all of its vertices to a cached Transformer in a single vectorized call.
+    Returns a new GeoSeries in the destination CRS with the same index.
+    """
+    # Data that is already in the target CRS (e.g. pre-projected site data) is passed through without touching a vertex
+    if CRS(src_crs) == CRS(dst_crs):
+        return gpd.GeoSeries(geoms.values, index=geoms.index, crs=dst_crs)
+
+    transformer = get_transformer(src_crs, dst_crs)
+
+    def transform_coords(coords):
+        x, y = transformer.transform(coords[:, 0], coords[:, 1])
+        return np.column_stack([x, y])
+
+    return gpd.GeoSeries(shapely.transform(geoms.values, transform_coords), index=geoms.index, crs=dst_crs)
+
+def project_gdf(gdf, dst_crs):
+    """Reprojects a GeoDataFrame to dst_crs using a cached Transformer; a drop-in replacement for gdf.to_crs(dst_crs)."""
+    return gdf.set_geometry(transform_geoseries(gdf.geometry, gdf.crs, dst_crs))
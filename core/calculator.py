@@ -1,32 +1,60 @@
+import math
+import os
+from collections import deque
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import rasterio
 from rasterio.features import shapes
-from shapely.geometry import shape
+from rasterio.enums import MaskFlags, Resampling
+from rasterio.transform import Affine
+from rasterio.windows import Window
+import shapely
+from shapely.geometry import shape, Polygon
+from shapely.affinity import affine_transform
 import geopandas as gpd
-from pyproj import CRS
+from pyproj import CRS, Transformer
 from pyproj.exceptions import CRSError
 import numpy as np
 
+from core._fastmath import utm_epsg_from_lonlat, rect_sides
+from core._transformer import project_gdf, transform_geoseries  # noqa: F401 - transform_geoseries is re-exported for the UI
+
+try:
+    import pyarrow  # noqa: F401 - only needed to enable Arrow transfer in pyogrio
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+def gdal_env():
+    """
+    Returns the rasterio.Env used for every TIFF read: a 512 MB GDAL block cache, so blocks touched by
+    several passes are decoded once, and multi-threaded decoding of compressed blocks on all CPUs.
+    """
+    return rasterio.Env(GDAL_CACHEMAX=512, GDAL_NUM_THREADS="ALL_CPUS")
+
 def get_optimal_utm_crs(gdf):
-    """Determines the optimal local UTM CRS for a given GeoDataFrame to minimize distortion."""
-    # Ensure the GeoDataFrame is in a geographic CRS (like WGS84) to get lat/lon bounds
-    gdf_geo = gdf.to_crs(epsg=4326)
-    
-    # Find the center of the data's geographic bounds
-    bounds = gdf_geo.total_bounds
-    centroid_lon = (bounds[0] + bounds[2]) / 2
-    
-    # Calculate the UTM zone from the longitude
-    utm_zone = int((centroid_lon + 180) / 6) + 1
-    
-    # Determine if the location is in the northern or southern hemisphere
-    # We can check the mean latitude of the geometry
-    centroid_lat = (bounds[1] + bounds[3]) / 2
+    """Determines the optimal local UTM CRS for a given GeoDataFrame (or GeoSeries) to minimize distortion."""
+    # Round the bounds so that repeated calls for the same data hit the cache
+    bounds = tuple(round(float(b), 6) for b in gdf.total_bounds)
+    return _optimal_utm_crs_for_bounds(CRS(gdf.crs), bounds)
+
+@lru_cache(maxsize=32)
+def _optimal_utm_crs_for_bounds(crs, bounds):
+    """Determines the optimal local UTM CRS for the given bounds expressed in the given CRS."""
+    # Only the four corners of the bounds are transformed to WGS84, not every vertex of the data
+    minx, miny, maxx, maxy = bounds
+    transformer = Transformer.from_crs(crs, 4326, always_xy=True)
+    lons, lats = transformer.transform([minx, maxx, maxx, minx], [miny, miny, maxy, maxy])
+
+    # Find the center of the data's geographic bounds. Like a representative point, this is plenty for
+    # picking a 6-degree zone, and unlike a centroid it never requires a union of the geometries.
+    centroid_lon = (min(lons) + max(lons)) / 2
+    centroid_lat = (min(lats) + max(lats)) / 2
     
-    # Construct the EPSG code. North is 326xx, South is 327xx.
-    if centroid_lat >= 0:
-        epsg_code = 32600 + utm_zone
-    else:
-        epsg_code = 32700 + utm_zone
+    # Calculate the UTM zone from the longitude and the hemisphere from the latitude.
+    # The EPSG code is 326xx in the north and 327xx in the south.
+    epsg_code = utm_epsg_from_lonlat(centroid_lon, centroid_lat)
+    utm_zone = epsg_code % 100
         
     try:
         # Verify that the calculated EPSG code is valid
@@ -37,73 +65,289 @@ def get_optimal_utm_crs(gdf):
         print(f"Warning: Could not determine local UTM zone {utm_zone}. Falling back to EPSG:3857.")
         return CRS.from_epsg(3857)
 
+def union_raster_shapes(geoms):
+    """
+    Merges polygons extracted from a single raster mask into one geometry.
+    Raster-derived polygons never overlap, so GEOS CoverageUnion can be used instead of a full unary union.
+    The polygons are passed straight to GEOS as an array, without building a GeoSeries around them.
+    """
+    # A single connected region needs no union at all
+    if len(geoms) == 1:
+        return geoms[0]
+    return shapely.coverage_union_all(geoms)
+
+def unify_roi(roi):
+    """Merges all features of an ROI GeoDataFrame into a single geometry, skipping the union for a single feature."""
+    if len(roi) == 1:
+        return roi.geometry.iloc[0]
+    # ROI features may overlap, so this is a full GEOS unary union rather than a coverage union. Calling shapely
+    # directly gives the same result as union_all(method='unary') on every supported GeoPandas version.
+    return shapely.union_all(roi.geometry.values)
+
+def read_opaque_mask(src, window=None, out_shape=None):
+    """
+    Reads which pixels of an open raster are opaque (alpha > 0) as a C-contiguous uint8 array of 0s and 1s.
+    GDAL's dataset mask is used when it is derived from the alpha band, as it avoids decoding the full band.
+    An out_shape decimates the read with nearest-neighbour resampling.
+    """
+    # Only byte alpha bands take the dataset-mask path: for wider ones a windowed alpha-derived mask is many
+    # times slower than reading the band itself, especially under gdal_env()'s large block cache
+    if src.dtypes[3] == "uint8" and MaskFlags.alpha in src.mask_flag_enums[0]:
+        alpha = src.dataset_mask(window=window, out_shape=out_shape, resampling=Resampling.nearest)
+    else:
+        alpha = src.read(4, window=window, out_shape=out_shape, resampling=Resampling.nearest)
+
+    if alpha.dtype == np.uint8:
+        # Threshold in place: the 0/1 result is written back into the alpha buffer through a bool view,
+        # so no second full-size array is allocated
+        np.greater(alpha, 0, out=alpha.view(bool))
+        return alpha
+
+    # Wider alpha bands cannot hold the result in place; the comparison yields a fresh C-contiguous bool array
+    # (which shapes() needs), viewed as uint8, and the alpha buffer is released before any GEOS work starts
+    mask = (alpha > 0).view(np.uint8)
+    del alpha
+    return mask
+
+def _polygonize_block(mask, window):
+    """Polygonizes one opaque-mask block in pixel coordinates and merges its shapes. Returns None for a fully transparent block."""
+    # Interior tiles of an orthomosaic are usually fully opaque and outer ones fully transparent;
+    # both are settled with a NumPy reduction instead of running GDAL's polygonizer
+    if not mask.any():
+        return None
+    if mask.all():
+        return shapely.box(window.col_off, window.row_off, window.col_off + window.width, window.row_off + window.height)
+
+    # Polygonize in (full-resolution) pixel coordinates so that shapes from neighbouring blocks share exact edges
+    pixel_transform = Affine.translation(window.col_off, window.row_off) * Affine.scale(
+        window.width / mask.shape[1], window.height / mask.shape[0]
+    )
+    # With mask=mask, shapes() only yields the opaque regions, so the values need no second check;
+    # the generator is drained once straight into an object array of geometries
+    block_shapes = np.fromiter(
+        (shape(geom) for geom, _ in shapes(mask, mask=mask, transform=pixel_transform)), dtype=object
+    )
+    if not block_shapes.size:
+        return None
+    return union_raster_shapes(block_shapes)
+
+POLYGONIZE_TILE_SIZE = 1024
+
+def _polygonize_windows(src, scale):
+    """Yields windows covering the raster, sized so that each one is POLYGONIZE_TILE_SIZE pixels square after decimation."""
+    # Fixed tiles rather than the file's own blocks: strip-organized TIFFs can have one-row blocks,
+    # and decimation needs window offsets that are multiples of the scale
+    step = POLYGONIZE_TILE_SIZE * scale
+    for row_off in range(0, src.height, step):
+        for col_off in range(0, src.width, step):
+            yield Window(col_off, row_off, min(step, src.width - col_off), min(step, src.height - row_off))
+
+CASCADE_THRESHOLD = 256
+
+def _cascaded_union(geoms, chunk=128):
+    """Unions geometries in chunks and then unions the partial results, which is much faster than one huge union."""
+    partials = [shapely.union_all(geoms[i:i + chunk]) for i in range(0, len(geoms), chunk)]
+    return shapely.union_all(partials)
+
+def _decimated_masks(src, scale):
+    """Yields (opaque mask, window) pairs covering the raster, each mask decimated by scale at read time."""
+    for window in _polygonize_windows(src, scale):
+        out_shape = None
+        if scale > 1:
+            out_shape = (math.ceil(window.height / scale), math.ceil(window.width / scale))
+        yield read_opaque_mask(src, window, out_shape), window
+
+def _polygonize_masks(src, masks):
+    """Polygonizes (opaque mask, window) pairs and merges them into one geometry in the raster's CRS, or None if all are empty."""
+    # GDAL datasets are not thread-safe, so blocks are read here and only the GEOS work
+    # (which releases the GIL) runs in the pool. The number of blocks in flight is bounded to keep memory flat.
+    max_workers = os.cpu_count() or 1
+    pending = deque()
+    tile_unions = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for mask, window in masks:
+            pending.append(executor.submit(_polygonize_block, mask, window))
+            if len(pending) >= 2 * max_workers:
+                tile_unions.append(pending.popleft().result())
+        tile_unions.extend(future.result() for future in pending)
+
+    tile_unions = [geom for geom in tile_unions if geom is not None]
+    if not tile_unions:
+        return None
+
+    # Shapes from different blocks are not noded against each other, so they need a full union
+    if len(tile_unions) == 1:
+        unified = tile_unions[0]
+    elif len(tile_unions) > CASCADE_THRESHOLD:
+        unified = _cascaded_union(tile_unions)
+    else:
+        unified = shapely.union_all(tile_unions)
+    t = src.transform
+    return affine_transform(unified, [t.a, t.b, t.d, t.e, t.c, t.f])
+
+def polygonize_alpha(src, scale=1):
+    """
+    Polygonizes the opaque (alpha > 0) region of an open raster into a single geometry in the raster's CRS.
+    With scale > 1 the mask is decimated by that factor (nearest neighbour) first, for a coarser but much cheaper outline.
+    Returns None if the raster has no opaque pixels.
+    """
+    return _polygonize_masks(src, _decimated_masks(src, scale))
+
+def count_and_polygonize_alpha(src, scale=1):
+    """
+    Counts the opaque pixels of an open raster and polygonizes its opaque region, reading the alpha mask only once.
+    The count is taken at full resolution; the outline is traced on the same mask decimated by scale.
+    Returns the pixel count and the geometry (None if there are no opaque pixels).
+    """
+    opaque_pixels = 0
+
+    def counted_masks():
+        nonlocal opaque_pixels
+        for window in _polygonize_windows(src, scale):
+            mask = read_opaque_mask(src, window)
+            opaque_pixels += np.count_nonzero(mask)
+            if scale > 1:
+                # Strided slicing is a nearest-neighbour decimation of the mask that is already in memory
+                mask = np.ascontiguousarray(mask[::scale, ::scale])
+            yield mask, window
+
+    geometry = _polygonize_masks(src, counted_masks())
+    return opaque_pixels, geometry
+
+_overview_hint_shown = False
+
+def read_downsampled(src, scale):
+    """
+    Reads all bands of an open raster downsampled by roughly the given factor, for display.
+    Returns the image and the affine transform matching it.
+    """
+    global _overview_hint_shown
+    # GDAL serves a decimated out_shape read from the best overview on its own; without a fine enough
+    # one it has to decode the full-resolution image, which the user is told about once
+    all_overviews = src.overviews(1)
+    if not any(factor <= scale for factor in all_overviews) and not _overview_hint_shown:
+        if all_overviews:
+            print(f"Hint: TIFF has no overview finer than {scale}x; build one with 'rio overview --build auto' for faster previews.")
+        else:
+            print("Hint: TIFF has no overviews; build them with 'rio overview --build auto' for faster previews.")
+        _overview_hint_shown = True
+
+    # Nearest neighbour only copies bytes, and at these reduction factors it looks no different from bilinear
+    out_shape = (src.count, max(1, int(src.height // scale)), max(1, int(src.width // scale)))
+    image = src.read(out_shape=out_shape, resampling=Resampling.nearest)
+    transform = src.transform * src.transform.scale((src.width / image.shape[-1]), (src.height / image.shape[-2]))
+    return image, transform
+
+def count_opaque_pixels(src):
+    """Counts the pixels of an open raster whose alpha (4th) band is non-zero, reading one tile at a time."""
+    opaque_pixels = 0
+    # The same fixed tiles as polygonizing, so strip TIFFs with one-row blocks aren't read one row per call
+    for window in _polygonize_windows(src, 1):
+        opaque_pixels += np.count_nonzero(read_opaque_mask(src, window))
+    return opaque_pixels
+
+def raster_footprint(src):
+    """Returns the full extent of an open raster as a single-row GeoDataFrame in the raster's CRS."""
+    corners = [src.transform * (col, row) for col, row in ((0, 0), (src.width, 0), (src.width, src.height), (0, src.height))]
+    return gpd.GeoDataFrame(geometry=[Polygon(corners)], crs=src.crs)
+
+def pixel_area_m2(src, metric_crs):
+    """Returns the ground area of a single pixel of an open raster, measured in the given metric CRS."""
+    footprint_metric = raster_footprint(src).pipe(project_gdf, metric_crs)
+    return footprint_metric.area.iloc[0] / (src.width * src.height)
+
 def calculate_tiff_area_m2(tiff_path):
-    """Calculates the area of the opaque region of a TIFF file in square meters."""
-    with rasterio.open(tiff_path) as src:
+    """
+    Calculates the area of the opaque region of a TIFF file in square meters without polygonizing it.
+    The opaque pixel count is multiplied by the ground area of one pixel in the optimal local projection.
+    """
+    with gdal_env(), rasterio.open(tiff_path) as src:
         if src.count < 4:
             raise ValueError("TIFF file must have an alpha channel (4 channels required).")
-        
-        alpha = src.read(4)
-        mask = alpha > 0
-        
-        results = ({'geometry': shape(geom)} for geom, val in shapes(alpha, mask=mask, transform=src.transform) if val > 0)
-        geoms = list(results)
-        
-        if not geoms:
+
+        opaque_pixels = count_opaque_pixels(src)
+        if not opaque_pixels:
             raise ValueError("No opaque areas with value > 0 found in the TIFF file.")
-            
-        gdf = gpd.GeoDataFrame(geometry=[g["geometry"] for g in geoms], crs=src.crs)
-        
-        # Dissolve all generated shapes into a single feature to ensure total area is calculated.
-        gdf_dissolved = gdf.dissolve()
 
-        # Determine and reproject to the optimal local projection for this data
-        optimal_crs = get_optimal_utm_crs(gdf_dissolved)
-        gdf_metric = gdf_dissolved.to_crs(optimal_crs)
-        
-        # Return the area of the single, unified geometry.
-        return gdf_metric.area.iloc[0]
+        optimal_crs = get_optimal_utm_crs(raster_footprint(src))
+        return opaque_pixels * pixel_area_m2(src, optimal_crs)
+
+# Sidecar files that change what read_shapefile returns: the index and the CRS definition
+SHAPEFILE_SIDECARS = (".shx", ".prj")
+
+def shapefile_key(shp_path):
+    """
+    Returns a cache key for a shapefile: its path and the modification times of the .shp and its sidecars.
+    A sidecar that does not exist contributes None, so adding or removing one also changes the key.
+    """
+    base = os.path.splitext(shp_path)[0]
+    mtimes = [os.path.getmtime(shp_path)]
+    for ext in SHAPEFILE_SIDECARS:
+        # Sidecar extensions may be upper case, as written by some desktop GIS tools
+        sidecar = next((base + e for e in (ext, ext.upper()) if os.path.exists(base + e)), None)
+        mtimes.append(os.path.getmtime(sidecar) if sidecar else None)
+    return (shp_path, tuple(mtimes))
+
+def read_shapefile(shp_path):
+    """
+    Reads the geometries of a shapefile with the pyogrio engine, transferring the data through Arrow when pyarrow is installed.
+    Attribute columns are never used, so they are not decoded.
+    """
+    return gpd.read_file(shp_path, engine="pyogrio", use_arrow=HAS_PYARROW, columns=[])
+
+@lru_cache(maxsize=8)
+def _read_projected_roi(key):
+    roi = read_shapefile(key[0])
+    # Determine and reproject to the optimal local projection for this data
+    return project_gdf(roi, get_optimal_utm_crs(roi))
+
+def _projected_roi(shp_path):
+    """
+    Returns the shapefile's features projected to their optimal UTM CRS, cached under shapefile_key() like the
+    worker's ROI cache. The GeoDataFrame is shared between callers, so it must only be read, never modified.
+    """
+    return _read_projected_roi(shapefile_key(shp_path))
 
 def calculate_roi_area_m2(shp_path):
     """Calculates the total area of a shapefile's features in square meters."""
-    roi = gpd.read_file(shp_path)
-    
-    # Determine and reproject to the optimal local projection for this data
-    optimal_crs = get_optimal_utm_crs(roi)
-    roi_metric = roi.to_crs(optimal_crs)
+    # The cached projected ROI is shared with calculate_roi_dimensions_m, so the file is read and reprojected
+    # once; it is only read here (unify_roi does not modify it)
+    roi_metric = _projected_roi(shp_path)
     
     # First, merge all features into a single geometry to handle multi-part or overlapping shapes correctly.
-    unified_geometry = roi_metric.unary_union
+    unified_geometry = unify_roi(roi_metric)
     
     # Then, calculate the area of the single, unified shape.
-    return unified_geometry.area
+    return shapely.area(unified_geometry)
+
+def rotated_rect_dimensions(rect):
+    """
+    Measures the first two sides of a rotated rectangle.
+    Returns the shorter side, the longer side, the index (0 or 1) of the side that is the width,
+    and the corner coordinates as an (N, 2) array.
+    """
+    # get_coordinates returns a fresh C-contiguous (N, 2) float64 array in a single call
+    coords = shapely.get_coordinates(rect)
+    sides = rect_sides(coords)
+    # argmin picks the first side on a tie, so a square keeps side 0 as its width
+    width_side_index = int(np.argmin(sides))
+    return float(sides[width_side_index]), float(sides[1 - width_side_index]), width_side_index, coords
 
 def calculate_roi_dimensions_m(shp_path):
     """
     Calculates the width and height of the minimum rotated rectangle of a shapefile.
     Returns the shorter side as width, the longer side as height, and the rectangle geometry.
     """
-    roi = gpd.read_file(shp_path)
-
-    # Determine and reproject to the optimal local projection for this data
-    optimal_crs = get_optimal_utm_crs(roi)
-    roi_metric = roi.to_crs(optimal_crs)
+    # Shared with calculate_roi_area_m2 through the cache and only read here
+    roi_metric = _projected_roi(shp_path)
     
     # Dissolve all features into a single geometry to properly calculate the overall rectangle
-    unified_geometry = roi_metric.unary_union
+    unified_geometry = unify_roi(roi_metric)
     
     # Get the minimum rotated rectangle, which is the smallest possible bounding box at any angle
-    rotated_rect = unified_geometry.minimum_rotated_rectangle
-    
-    # Get the coordinates of the rectangle's corners
-    x, y = rotated_rect.exterior.coords.xy
-    
-    # Calculate the length of the first two unique sides of the rectangle
-    side1_length = ((x[1] - x[0])**2 + (y[1] - y[0])**2)**0.5
-    side2_length = ((x[2] - x[1])**2 + (y[2] - y[1])**2)**0.5
+    rotated_rect = shapely.minimum_rotated_rectangle(unified_geometry)
     
-    # Assign width and height based on length
-    width = min(side1_length, side2_length)
-    height = max(side1_length, side2_length)
+    # Shorter side is the width, longer side is the height
+    width, height, _, _ = rotated_rect_dimensions(rotated_rect)
     
-    return width, height, rotated_rect 
\ No newline at end of file
+    return width, height, rotated_rect
@@ -1,8 +1,9 @@
 import sys
 import os
-import matplotlib.pyplot as plt
+import matplotlib
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QFont
+from PySide6.QtCore import QTimer
 
 # Suppress Qt warnings and threading issues on macOS
 os.environ['QT_MAC_WANTS_LAYER'] = '1'
@@ -23,6 +24,11 @@ if sys.platform == 'darwin':
 from ui.main_window import UAVAreaCalculator
 from utils.resources import get_app_icon, load_custom_fonts
 
+def warm_up_kernels():
+    """Imports Numba and compiles the numeric kernels; imported here rather than at the top so startup doesn't load Numba."""
+    from core._fastmath import warm_up_kernels as compile_kernels
+    compile_kernels()
+
 def main():
     """
     Main function to initialize and run the UAV Area Calculator application.
@@ -34,7 +40,7 @@ def main():
     app.setFont(QFont("fccTYPO", 11))
 
     # Set default font for matplotlib plots to match
-    plt.rcParams['font.family'] = 'fccTYPO'
+    matplotlib.rcParams['font.family'] = 'fccTYPO'
     
     # Load and set the application icon
     app_icon = get_app_icon()
@@ -44,6 +50,10 @@ def main():
     # Create and show the main window
     window = UAVAreaCalculator(app_icon=app_icon)
     window.show()
+
+    # Compile the numeric kernels on the calculation thread once the window is up. The first calculation
+    # is queued behind it, so it doesn't pay the JIT cost, and the first frame isn't delayed by it either.
+    QTimer.singleShot(0, lambda: window.calc_executor.submit(warm_up_kernels))
     
     sys.exit(app.exec())
 
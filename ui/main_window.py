@@ -1,24 +1,29 @@
 import sys
 import os
-import rasterio
-import rasterio.plot
-from rasterio.enums import Resampling
-from rasterio.features import shapes
-from shapely.geometry import shape
-import geopandas as gpd
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.collections import PathCollection
+from matplotlib.path import Path
+from matplotlib.font_manager import FontProperties
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QLineEdit, QFileDialog, QFrame, QRadioButton,
-    QGroupBox, QProgressBar, QSpinBox, QComboBox, QCheckBox
+    QGroupBox, QProgressBar, QSpinBox, QComboBox, QCheckBox, QButtonGroup
 )
 from PySide6.QtGui import QFont
-from PySide6.QtCore import Qt, QTimer, QObject, Signal, QThread
+from PySide6.QtCore import Qt, QTimer, QObject, Signal
 
-# Import the refactored calculation logic
-from core.calculator import get_optimal_utm_crs
+# The geospatial stack (rasterio/GDAL, GeoPandas, shapely, pyproj/PROJ) and the calculation logic built on it
+# are imported inside the functions that use them, so the window opens without loading them first.
+# They are first needed by the calculation worker, off the GUI thread.
+
+# Decimation factor for the TIFF footprint that is drawn on the map
+FOOTPRINT_SCALE = 4
+# Downsampling factor for the TIFF image shown in the preview
+PREVIEW_SCALE = 30
 
 class CalculationWorker(QObject):
     """
@@ -28,72 +33,159 @@ class CalculationWorker(QObject):
     calculation_finished = Signal(dict)
     calculation_error = Signal(str)
 
-    def __init__(self, tiff_path, shp_path):
+    def __init__(self, tiff_path, shp_path, tiff_cache=None, roi_cache=None):
         super().__init__()
         self.tiff_path = tiff_path
         self.shp_path = shp_path
+        # TIFF results of a previous run; reused if they were computed from the same, unmodified file
+        self.tiff_cache = tiff_cache
+        # The ROI of a previous run, as read and as projected; reused under the same conditions
+        self.roi_cache = roi_cache
+
+    def process_tiff(self):
+        """Reads the TIFF once and returns everything derived from it: the area, the optimal CRS, the footprint and the preview."""
+        import rasterio
+        import geopandas as gpd
+        from core.calculator import (
+            gdal_env, get_optimal_utm_crs, count_and_polygonize_alpha, polygonize_alpha, raster_footprint,
+            pixel_area_m2, read_downsampled, transform_geoseries
+        )
+
+        self.progress_update.emit(5, "Processing (1/8): Reading TIFF file...")
+        with gdal_env(), rasterio.open(self.tiff_path) as src:
+            if src.count < 4:
+                raise ValueError("TIFF file must have an alpha channel.")
+
+            # The area only needs the opaque pixel count, while the footprint is only drawn and can be traced
+            # on a decimated mask. Both come from a single pass over the full-resolution alpha mask.
+            self.progress_update.emit(15, "Processing (2/8): Reading TIFF alpha mask...")
+            opaque_pixels, tiff_footprint = count_and_polygonize_alpha(src, scale=FOOTPRINT_SCALE)
+            if not opaque_pixels:
+                raise ValueError("No opaque areas found in TIFF.")
+            footprint_scale = FOOTPRINT_SCALE
+            if tiff_footprint is None:
+                # Every opaque pixel fell between the decimated samples (e.g. thin stripes or isolated pixels),
+                # so trace the outline at full resolution instead
+                footprint_scale = 1
+                tiff_footprint = polygonize_alpha(src)
+
+            self.progress_update.emit(25, "Processing (3/8): Calculating TIFF area...")
+            optimal_crs = get_optimal_utm_crs(raster_footprint(src))
+            tiff_area_m2 = opaque_pixels * pixel_area_m2(src, optimal_crs)
+
+            # Computing the footprint once here saves re-polygonizing on every redraw
+            self.progress_update.emit(35, "Processing (4/8): Projecting TIFF footprint...")
+            # Simplifying within half a decimated pixel drops most vertices before the per-vertex reprojection.
+            # The outline is only drawn, so the cheaper non-topology-preserving Douglas-Peucker is enough.
+            tiff_footprint = tiff_footprint.simplify(abs(src.transform.a) * footprint_scale * 0.5, preserve_topology=False)
+            tiff_footprint_optimal = transform_geoseries(gpd.GeoSeries([tiff_footprint]), src.crs, optimal_crs)
+            tiff_gdf_optimal = gpd.GeoDataFrame(geometry=tiff_footprint_optimal)
+
+            # Read the preview image while the TIFF is open, so the GUI thread never has to reopen it.
+            # Without overviews this read has to decode the full-resolution image, which the user is told about.
+            preview_image, preview_transform = read_downsampled(src, scale=PREVIEW_SCALE)
+            has_overviews = src.overviews(1)
+
+        return {
+            "tiff_area_m2": tiff_area_m2,
+            "optimal_crs": optimal_crs,
+            "tiff_gdf_optimal": tiff_gdf_optimal,
+            "preview_image": preview_image,
+            "preview_transform": preview_transform,
+            "has_overviews": bool(has_overviews),
+        }
 
     def run(self):
         """The main work of the thread, broken into granular steps."""
         try:
-            # --- TIFF Processing ---
-            self.progress_update.emit(5, "Processing (1/8): Reading TIFF file...")
-            with rasterio.open(self.tiff_path) as src:
-                if src.count < 4:
-                    raise ValueError("TIFF file must have an alpha channel.")
-                
-                alpha = src.read(4)
-                mask = alpha > 0
-                crs = src.crs
-
-            self.progress_update.emit(15, "Processing (2/8): Extracting TIFF geometry...")
-            results_gen = ({'geometry': shape(geom)} for geom, val in shapes(alpha, mask=mask, transform=src.transform) if val > 0)
-            geoms = list(results_gen)
-            if not geoms:
-                raise ValueError("No opaque areas found in TIFF.")
-
-            self.progress_update.emit(25, "Processing (3/8): Unifying TIFF shapes...")
-            gdf = gpd.GeoDataFrame(geometry=[g["geometry"] for g in geoms], crs=crs)
-            gdf_dissolved = gdf.dissolve()
+            # Imported here, inside the try, so a broken geospatial install is reported like any other error
+            import shapely
+            from core.calculator import read_shapefile, shapefile_key, project_gdf, unify_roi, rotated_rect_dimensions
+
+            # The key covers the .prj and .shx as well, so redefining the projection invalidates the cached ROI
+            roi_key = shapefile_key(self.shp_path)
+            roi_cached = self.roi_cache is not None and self.roi_cache["key"] == roi_key
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # The shapefile read does not depend on the TIFF, so it runs alongside the raster processing
+                if not roi_cached:
+                    roi_future = executor.submit(read_shapefile, self.shp_path)
+
+                # --- TIFF Processing ---
+                # Recalculating with only a new shapefile (or after editing it) skips the TIFF entirely
+                tiff_key = (self.tiff_path, os.path.getmtime(self.tiff_path))
+                if self.tiff_cache is not None and self.tiff_cache["key"] == tiff_key:
+                    self.progress_update.emit(35, "Processing (1-4/8): Reusing results for the unchanged TIFF...")
+                    tiff_results = self.tiff_cache
+                else:
+                    tiff_results = dict(self.process_tiff(), key=tiff_key)
+                optimal_crs = tiff_results["optimal_crs"]
 
-            self.progress_update.emit(35, "Processing (4/8): Calculating TIFF area...")
-            optimal_crs = get_optimal_utm_crs(gdf_dissolved)
-            gdf_metric = gdf_dissolved.to_crs(optimal_crs)
-            tiff_area_m2 = gdf_metric.area.iloc[0]
+                # --- ROI Processing ---
+                self.progress_update.emit(45, "Processing (5/8): Reading Shapefile...")
+                roi = self.roi_cache["roi"] if roi_cached else roi_future.result()
 
-            # --- ROI Processing ---
-            self.progress_update.emit(45, "Processing (5/8): Reading Shapefile...")
-            roi = gpd.read_file(self.shp_path)
-            
-            # Use the same optimal coordinate system as the TIFF to ensure proper alignment
-            roi_metric = roi.to_crs(optimal_crs)
+            # Use the same optimal coordinate system as the TIFF to ensure proper alignment;
+            # the projection is only redone if the file or the target CRS changed
+            if roi_cached and self.roi_cache["crs"] == optimal_crs:
+                roi_metric = self.roi_cache["roi_metric"]
+            else:
+                roi_metric = project_gdf(roi, optimal_crs)
 
             self.progress_update.emit(55, "Processing (6/8): Calculating ROI area...")
-            unified_geometry = roi_metric.unary_union
-            roi_area_m2 = unified_geometry.area
+            unified_geometry = unify_roi(roi_metric)
+            roi_area_m2 = shapely.area(unified_geometry)
 
             self.progress_update.emit(65, "Processing (7/8): Calculating ROI dimensions...")
-            rotated_rect = unified_geometry.minimum_rotated_rectangle
-            x, y = rotated_rect.exterior.coords.xy
-            side1_length = ((x[1] - x[0])**2 + (y[1] - y[0])**2)**0.5
-            side2_length = ((x[2] - x[1])**2 + (y[2] - y[1])**2)**0.5
-            roi_width_m = min(side1_length, side2_length)
-            roi_height_m = max(side1_length, side2_length)
+            rotated_rect = shapely.minimum_rotated_rectangle(unified_geometry)
+            roi_width_m, roi_height_m, roi_width_side_index, _ = rotated_rect_dimensions(rotated_rect)
 
             # --- Finalize ---
             self.progress_update.emit(75, "Processing (8/8): Finalizing results...")
             results = {
-                "tiff_area_m2": tiff_area_m2,
+                "tiff_area_m2": tiff_results["tiff_area_m2"],
                 "roi_area_m2": roi_area_m2,
                 "roi_width_m": roi_width_m,
                 "roi_height_m": roi_height_m,
                 "roi_rotated_rect": rotated_rect,
+                "roi_width_side_index": roi_width_side_index,
+                "tiff_gdf_optimal": tiff_results["tiff_gdf_optimal"],
+                "roi_metric": roi_metric,
+                "optimal_crs": optimal_crs,
+                "preview_image": tiff_results["preview_image"],
+                "preview_transform": tiff_results["preview_transform"],
+                "tiff_path": self.tiff_path,
+                "shp_path": self.shp_path,
+                "tiff_cache": tiff_results,
+                "roi_cache": {"key": roi_key, "roi": roi, "crs": optimal_crs, "roi_metric": roi_metric},
             }
             self.calculation_finished.emit(results)
         except Exception as e:
             self.calculation_error.emit(str(e))
 
 
+def raster_display_data(image, transform):
+    """Returns the imshow array (rows, cols, bands for RGB(A), otherwise the first band) and extent of a (bands, rows, cols) raster."""
+    from rasterio.plot import plotting_extent
+    extent = plotting_extent(image[0], transform)
+    if image.shape[0] in (3, 4):
+        return np.moveaxis(image, 0, -1), extent
+    return image[0], extent
+
+def geometry_paths(gdf):
+    """Builds one compound matplotlib Path per (multi)polygon of a GeoDataFrame, with holes as extra rings like GeoPandas draws them."""
+    import shapely
+    paths = []
+    for geom in gdf.geometry:
+        rings = [ring for polygon in shapely.get_parts(geom) for ring in (polygon.exterior, *polygon.interiors)]
+        paths.append(Path.make_compound_path(*(Path(shapely.get_coordinates(ring), closed=True) for ring in rings)))
+    return paths
+
+def show_raster(ax, image, transform):
+    """Draws a (bands, rows, cols) raster array on the axes with imshow, positioned by its affine transform. Returns the AxesImage."""
+    data, extent = raster_display_data(image, transform)
+    return ax.imshow(data, extent=extent, origin='upper', cmap=None if data.ndim == 3 else 'gray')
+
+
 class UAVAreaCalculator(QMainWindow):
     def __init__(self, app_icon=None):
         super().__init__()
@@ -109,13 +201,30 @@ class UAVAreaCalculator(QMainWindow):
         self.roi_width_m = 0
         self.roi_height_m = 0
         self.roi_rotated_rect = None
+        self.roi_width_side_index = 0
+        # The files the current results were calculated from; the path fields may have been edited since
+        self.result_tiff_path = None
+        self.result_shp_path = None
+        self.tiff_gdf_optimal = None
+        self.roi_metric = None
+        self.optimal_crs = None
+        self.preview_image = None
+        self.preview_transform = None
+        self.tiff_cache = None  # TIFF results of the last run, keyed by path and modification time
+        self.roi_cache = None  # ROI of the last run (native and projected), keyed by the .shp and sidecar modification times
         
         # Export variables
-        self.export_dpi = 600  # Always 600 DPI
+        self.export_dpi = 300  # Taken from the DPI spin box when exporting
         self.export_format = "PNG"  # Always PNG
         self.export_show_measurements = True
         self.export_show_areas = True
 
+        # Background work runs on long-lived single-thread executors instead of a new QThread per run,
+        # so calculations (and exports) are serialized. These are Python threads rather than QThreadPool
+        # threads: PROJ's per-thread context does not survive Qt recycling a pool thread between runs.
+        self.calc_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="calculation")
+        self.export_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="export")
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -172,7 +281,12 @@ class UAVAreaCalculator(QMainWindow):
         self.ha_radio = QRadioButton("Hectares (ha)")
         self.ha_radio.setChecked(True)
         self.m2_radio = QRadioButton("Square meters (m²)")
-        self.ha_radio.toggled.connect(self.update_display)
+        # One signal per unit change for the whole group, rather than a toggled signal per radio button.
+        # Switching units only relabels the results; the map annotates metres and is not redrawn.
+        self.unit_buttons = QButtonGroup(self)
+        self.unit_buttons.addButton(self.ha_radio)
+        self.unit_buttons.addButton(self.m2_radio)
+        self.unit_buttons.buttonClicked.connect(lambda _button: self.update_display())
         unit_layout.addWidget(self.ha_radio)
         unit_layout.addWidget(self.m2_radio)
         unit_group.setLayout(unit_layout)
@@ -210,6 +324,18 @@ class UAVAreaCalculator(QMainWindow):
         self.show_areas_check.toggled.connect(self.on_show_areas_changed)
         export_layout.addWidget(self.show_areas_check)
         
+        # Export resolution; every doubling of the DPI quadruples the pixels to render and encode
+        self.export_dpi_spin = QSpinBox()
+        self.export_dpi_spin.setRange(150, 600)
+        self.export_dpi_spin.setSingleStep(50)
+        self.export_dpi_spin.setValue(self.export_dpi)
+        self.export_dpi_spin.setSuffix(" DPI")
+        
+        dpi_layout = QHBoxLayout()
+        dpi_layout.addWidget(QLabel("Resolution:"))
+        dpi_layout.addWidget(self.export_dpi_spin)
+        export_layout.addLayout(dpi_layout)
+        
         # Export button
         self.export_button = QPushButton("Export High-Resolution PNG")
         self.export_button.clicked.connect(self.export_high_res_image)
@@ -232,7 +358,18 @@ class UAVAreaCalculator(QMainWindow):
         layout.addStretch() # Pushes everything to the top
 
     def setup_right_panel(self, layout):
-        self.fig, self.ax = plt.subplots()
+        # Use the object-oriented API so the preview figure is not tracked by pyplot's global state.
+        # Constrained layout is solved as part of each draw, so refreshes need no separate tight_layout pass.
+        self.fig = Figure(layout='constrained')
+        self.ax = self.fig.add_subplot(111)
+        self.ax.set_xticks([])
+        self.ax.set_yticks([])
+        for spine in self.ax.spines.values():
+            spine.set_visible(False)
+        # The preview's AxesImage and polygon overlays are created on the first draw and then updated in place
+        self.preview_artist = None
+        self.tiff_overlay = None
+        self.roi_overlay = None
         self.canvas = FigureCanvas(self.fig)
         layout.addWidget(self.canvas)
         self.update_visualization() # Initial placeholder
@@ -271,24 +408,25 @@ class UAVAreaCalculator(QMainWindow):
         self.status_label.setText("Starting processing...")
         self.progress_bar.show()
 
-        # --- Worker Thread Setup ---
-        self.thread = QThread()
-        self.worker = CalculationWorker(tiff_path, shp_path)
-        self.worker.moveToThread(self.thread)
+        # --- Worker Setup ---
+        self.worker = CalculationWorker(tiff_path, shp_path, self.tiff_cache, self.roi_cache)
 
         # --- Signal / Slot Connections ---
-        self.thread.started.connect(self.worker.run)
+        # The worker object lives in the GUI thread, so signals emitted from the executor thread are queued back to it
         self.worker.progress_update.connect(self.update_progress)
         self.worker.calculation_finished.connect(self.handle_results)
         self.worker.calculation_error.connect(self.handle_error)
 
-        # --- Cleanup ---
-        self.worker.calculation_finished.connect(self.thread.quit)
-        self.worker.calculation_error.connect(self.thread.quit)
-        self.thread.finished.connect(self.worker.deleteLater)
-        self.thread.finished.connect(self.thread.deleteLater)
+        future = self.calc_executor.submit(self.worker.run)
+        # An exception that still escapes run() would otherwise sit unread in the future and leave the UI waiting
+        future.add_done_callback(lambda f, worker=self.worker: self.report_escaped_error(worker, f))
 
-        self.thread.start()
+    @staticmethod
+    def report_escaped_error(worker, future):
+        """Done-callback for the calculation future; forwards an exception raised outside the worker's own handling."""
+        error = future.exception()
+        if error is not None:
+            worker.calculation_error.emit(str(error))
 
     def update_progress(self, value, text):
         """Slot to receive progress updates from the worker."""
@@ -311,6 +449,16 @@ class UAVAreaCalculator(QMainWindow):
         self.roi_width_m = results["roi_width_m"]
         self.roi_height_m = results["roi_height_m"]
         self.roi_rotated_rect = results["roi_rotated_rect"]
+        self.roi_width_side_index = results["roi_width_side_index"]
+        self.result_tiff_path = results["tiff_path"]
+        self.result_shp_path = results["shp_path"]
+        self.tiff_gdf_optimal = results["tiff_gdf_optimal"]
+        self.roi_metric = results["roi_metric"]
+        self.optimal_crs = results["optimal_crs"]
+        self.preview_image = results["preview_image"]
+        self.preview_transform = results["preview_transform"]
+        self.tiff_cache = results["tiff_cache"]
+        self.roi_cache = results["roi_cache"]
         
         self.update_display()
         
@@ -321,7 +469,11 @@ class UAVAreaCalculator(QMainWindow):
         # Enable export button now that we have results
         self.export_button.setEnabled(True)
         
-        self.status_label.setText("Processing complete. Ready.")
+        if self.tiff_cache["has_overviews"]:
+            self.status_label.setText("Processing complete. Ready.")
+        else:
+            # Building overviews writes to the user's data, so the app only suggests it ('rio overview --build auto')
+            self.status_label.setText("Processing complete. Tip: add TIFF overviews for faster previews.")
         self.cleanup_after_run()
 
     def cleanup_after_run(self):
@@ -342,7 +494,7 @@ class UAVAreaCalculator(QMainWindow):
 
     def export_high_res_image(self):
         """Export a high-resolution PNG image with overlays and measurements in a background thread."""
-        if not self.tiff_path_edit.text() or not self.shp_path_edit.text():
+        if not self.result_tiff_path or not self.result_shp_path:
             self.status_label.setText("Error: Please load data first.")
             return
             
@@ -363,22 +515,17 @@ class UAVAreaCalculator(QMainWindow):
         if not file_path:
             return
 
+        self.export_dpi = self.export_dpi_spin.value()
         self.status_label.setText("Exporting, please wait...")
         self.export_button.setEnabled(False)
         QApplication.processEvents()
 
-        # Set up export worker and thread
-        self.export_thread = QThread()
-        self.export_worker = ExportWorker(file_path, self.create_high_res_export)
-        self.export_worker.moveToThread(self.export_thread)
-        self.export_thread.started.connect(self.export_worker.run)
+        # Set up export worker and run it on the export thread. The worker gets a snapshot of the results,
+        # so a calculation that finishes while it runs cannot mix two datasets into one image.
+        self.export_worker = ExportWorker(file_path, self.export_snapshot(), self.create_high_res_export)
         self.export_worker.finished.connect(self.handle_export_finished)
         self.export_worker.error.connect(self.handle_export_error)
-        self.export_worker.finished.connect(self.export_thread.quit)
-        self.export_worker.error.connect(self.export_thread.quit)
-        self.export_thread.finished.connect(self.export_worker.deleteLater)
-        self.export_thread.finished.connect(self.export_thread.deleteLater)
-        self.export_thread.start()
+        self.export_executor.submit(self.export_worker.run)
 
     def handle_export_finished(self, file_path):
         self.status_label.setText(f"Export complete: {os.path.basename(file_path)}")
@@ -390,194 +537,189 @@ class UAVAreaCalculator(QMainWindow):
         self.export_button.setEnabled(True)
         QTimer.singleShot(3000, lambda: self.status_label.setText("Ready"))
 
-    def create_high_res_export(self, file_path):
-        """Create a high-resolution export with overlays and measurements."""
-        # Create a new figure with high DPI and extra space for info
-        fig, (ax, ax_info) = plt.subplots(2, 1, figsize=(12, 10), dpi=self.export_dpi, 
-                                         gridspec_kw={'height_ratios': [15, 0.5]})
+    def export_snapshot(self):
+        """Returns the results and export settings the export draws, taken on the GUI thread."""
+        return {
+            "tiff_path": self.result_tiff_path,
+            "tiff_gdf_optimal": self.tiff_gdf_optimal,
+            "roi_metric": self.roi_metric,
+            "roi_rotated_rect": self.roi_rotated_rect,
+            "roi_width_side_index": self.roi_width_side_index,
+            "roi_width_m": self.roi_width_m,
+            "roi_height_m": self.roi_height_m,
+            "tiff_area_m2": self.tiff_area_m2,
+            "roi_area_m2": self.roi_area_m2,
+            "use_hectares": self.ha_radio.isChecked(),
+            "export_dpi": self.export_dpi,
+            "export_show_areas": self.export_show_areas,
+            "export_show_measurements": self.export_show_measurements,
+        }
+
+    def create_high_res_export(self, file_path, snapshot):
+        """Create a high-resolution export with overlays and measurements from a snapshot taken by export_snapshot()."""
+        import rasterio
+        import shapely
+        from core.calculator import gdal_env, read_downsampled
+
+        # Create a new figure with high DPI and extra space for info. It is built on its own Agg canvas
+        # rather than through pyplot, so the export thread never touches pyplot's global state or the Qt canvas.
+        fig = Figure(figsize=(12, 10), dpi=snapshot["export_dpi"])
+        canvas = FigureCanvasAgg(fig)
+        gs = fig.add_gridspec(2, 1, height_ratios=[15, 0.5])
+        ax = fig.add_subplot(gs[0])
+        ax_info = fig.add_subplot(gs[1])
         
-        tiff_path = self.tiff_path_edit.text()
-        shp_path = self.shp_path_edit.text()
-
-        try:
-            # Display high-resolution TIFF
-            with rasterio.open(tiff_path) as src:
-                # Use higher resolution for export
-                scale = 10  # Less downsampling for higher quality
-                out_shape = (src.count, int(src.height//scale), int(src.width//scale))
-                image = src.read(out_shape=out_shape, resampling=Resampling.bilinear)
-                transform = src.transform * src.transform.scale((src.width / image.shape[-1]), (src.height / image.shape[-2]))
-                rasterio.plot.show(image, transform=transform, ax=ax)
-            
-            # Plot TIFF polygon overlay if enabled
-            if self.export_show_areas:
-                with rasterio.open(tiff_path) as src:
-                    alpha = src.read(4)
-                    mask = alpha > 0
-                    results = ({'geometry': shape(geom)} for geom, val in shapes(alpha, mask=mask, transform=src.transform) if val > 0)
-                    geoms = list(results)
-                    gdf = gpd.GeoDataFrame(geometry=[g["geometry"] for g in geoms], crs=src.crs).dissolve()
-                    
-                    optimal_crs = get_optimal_utm_crs(gdf)
-                    gdf_optimal = gdf.to_crs(optimal_crs)
-                    gdf_optimal.plot(ax=ax, facecolor='red', edgecolor='red', alpha=0.3, linewidth=2)
+        # Display high-resolution TIFF. The image is read from the file the results were calculated from,
+        # so it always matches the overlays and areas even if the path field was edited since.
+        with gdal_env(), rasterio.open(snapshot["tiff_path"]) as src:
+            # Use higher resolution for export: less downsampling for higher quality
+            image, transform = read_downsampled(src, scale=10)
+            show_raster(ax, image, transform)
+        
+        # Plot TIFF polygon overlay if enabled, reusing the footprint the worker already extracted.
+        # The overlays are rasterized so a complex outline is drawn as one image rather than a path per vertex.
+        if snapshot["export_show_areas"]:
+            snapshot["tiff_gdf_optimal"].plot(ax=ax, facecolor='red', edgecolor='red', alpha=0.3, linewidth=2, rasterized=True)
+        
+        # Plot ROI polygon and measurements if enabled
+        if snapshot["export_show_areas"] or snapshot["export_show_measurements"]:
+            if snapshot["export_show_areas"]:
+                snapshot["roi_metric"].plot(ax=ax, facecolor='#4FC3F7', edgecolor='#29B6F6', alpha=0.6, linewidth=2, rasterized=True)
             
-            # Plot ROI polygon and measurements if enabled
-            if self.export_show_areas or self.export_show_measurements:
-                roi = gpd.read_file(shp_path)
-                optimal_crs = get_optimal_utm_crs(roi)
-                roi_optimal = roi.to_crs(optimal_crs)
+            # Draw measurements if enabled
+            if snapshot["export_show_measurements"] and snapshot["roi_rotated_rect"]:
+                # Draw the minimum rotated rectangle
+                ax.plot(*snapshot["roi_rotated_rect"].exterior.xy, color='black', linestyle='--', linewidth=2)  # Black dashed line for white background
                 
-                if self.export_show_areas:
-                    roi_optimal.plot(ax=ax, facecolor='#4FC3F7', edgecolor='#29B6F6', alpha=0.6, linewidth=2)
+                # Get the coordinates of the rectangle's corners
+                coords = shapely.get_coordinates(snapshot["roi_rotated_rect"])
                 
-                # Draw measurements if enabled
-                if self.export_show_measurements and self.roi_rotated_rect:
-                    # Draw the minimum rotated rectangle
-                    ax.plot(*self.roi_rotated_rect.exterior.xy, color='black', linestyle='--', linewidth=2)  # Black dashed line for white background
+                # Function to draw a dimension line with non-rotated text
+                def draw_dimension(coords, text):
+                    (x1, y1), (x2, y2) = coords
+                    mid_x = (x1 + x2) / 2
+                    mid_y = (y1 + y2) / 2
+                    ax.plot([x1, x2], [y1, y2], color='black', linestyle='-', linewidth=2)  # Black lines for white background
                     
-                    # Get the coordinates of the rectangle's corners
-                    x, y = self.roi_rotated_rect.exterior.coords.xy
+                    # Determine orientation to place text correctly without rotation
+                    is_horizontal = abs(x2 - x1) > abs(y2 - y1)
                     
-                    # Function to draw a dimension line with non-rotated text
-                    def draw_dimension(coords, text):
-                        x1, y1, x2, y2 = coords
-                        mid_x = (x1 + x2) / 2
-                        mid_y = (y1 + y2) / 2
-                        ax.plot([x1, x2], [y1, y2], color='black', linestyle='-', linewidth=2)  # Black lines for white background
-                        
-                        # Determine orientation to place text correctly without rotation
-                        is_horizontal = abs(x2 - x1) > abs(y2 - y1)
-                        
-                        ha = 'center' if is_horizontal else 'left'
-                        va = 'bottom' if is_horizontal else 'center'
-                        
-                        ax.text(mid_x, mid_y, f' {text} ', ha=ha, va=va, rotation=0,
-                                 fontsize=12, color='black', backgroundcolor='white', 
-                                 weight='bold', bbox=dict(boxstyle="round,pad=0.3", facecolor='white', alpha=0.9))
-
-                    # Determine which side is width vs height
-                    side1_len = np.sqrt((x[1] - x[0])**2 + (y[1] - y[0])**2)
+                    ha = 'center' if is_horizontal else 'left'
+                    va = 'bottom' if is_horizontal else 'center'
                     
-                    if np.isclose(side1_len, self.roi_width_m):
-                        width_coords = (x[0], y[0], x[1], y[1])
-                        height_coords = (x[1], y[1], x[2], y[2])
-                    else:
-                        width_coords = (x[1], y[1], x[2], y[2])
-                        height_coords = (x[0], y[0], x[1], y[1])
-
-                    # Draw width and height measurements
-                    draw_dimension(width_coords, f'{self.roi_width_m:.2f} m')
-                    draw_dimension(height_coords, f'{self.roi_height_m:.2f} m')
-
-            # Set up the map area
-            ax.set_xticks([])
-            ax.set_yticks([])
-            for spine in ax.spines.values():
-                spine.set_visible(False)
-            ax.axis('equal')
-            
-            # Create information area below the map
-            ax_info.set_xticks([])
-            ax_info.set_yticks([])
-            for spine in ax_info.spines.values():
-                spine.set_visible(False)
-            ax_info.set_facecolor('white')
-            fig.patch.set_facecolor('white')  # Ensure figure background is white
-            
-            # Calculate area values for display
-            unit_text = "ha" if self.ha_radio.isChecked() else "m²"
-            tiff_area_display = self.tiff_area_m2 / 10000 if self.ha_radio.isChecked() else self.tiff_area_m2
-            roi_area_display = self.roi_area_m2 / 10000 if self.ha_radio.isChecked() else self.roi_area_m2
-            
-            # Compose the info line with colored values using multiple text elements
-            tiff_label = f"TIFF Area: "
-            tiff_value = f"{tiff_area_display:.4f} {unit_text}"
-            roi_label = f" | ROI Area: "
-            roi_value = f"{roi_area_display:.4f} {unit_text}"
-
-            # Calculate total width for centering
-            dummy = ax_info.text(0.5, 0.5, tiff_label + tiff_value + roi_label + roi_value, fontsize=16, weight='bold', ha='center', va='center', color='black', alpha=0)
-            fig.canvas.draw()
-            renderer = fig.canvas.get_renderer()
-            bbox = dummy.get_window_extent(renderer=renderer)
-            dummy.remove()
-            width = bbox.width / fig.dpi / fig.get_figwidth()
-            x = 0.5 - width / 2
-            y = 0.5
-            def text_width(s, **kwargs):
-                t = ax_info.text(0, 0, s, fontsize=16, weight='bold', ha='left', va='center', color='black', alpha=0, **kwargs)
-                fig.canvas.draw()
-                w = t.get_window_extent(renderer=renderer).width / fig.dpi / fig.get_figwidth()
-                t.remove()
-                return w
-            tw1 = text_width(tiff_label)
-            tw2 = text_width(tiff_value)
-            tw3 = text_width(roi_label)
-            tw4 = text_width(roi_value)
-            ax_info.text(x, y, tiff_label, fontsize=16, weight='bold', ha='left', va='center', color='black', zorder=2, transform=ax_info.transAxes)
-            x += tw1
-            ax_info.text(x, y, tiff_value, fontsize=16, weight='bold', ha='left', va='center', color='red', zorder=2, transform=ax_info.transAxes)
-            x += tw2
-            ax_info.text(x, y, roi_label, fontsize=16, weight='bold', ha='left', va='center', color='black', zorder=2, transform=ax_info.transAxes)
-            x += tw3
-            ax_info.text(x, y, roi_value, fontsize=16, weight='bold', ha='left', va='center', color='#4FC3F7', zorder=2, transform=ax_info.transAxes)
-
-            fig.tight_layout()
-            
-            # Save with high quality settings
-            fig.savefig(file_path, dpi=self.export_dpi, bbox_inches='tight', 
-                       facecolor='white', edgecolor='none', transparent=False, pil_kwargs={"quality": 100})
-            
-            plt.close(fig)
-            
-        except Exception as e:
-            plt.close(fig)
-            raise e
-
-    def update_visualization(self):
-        self.ax.clear()
-        self.ax.set_xticks([])
-        self.ax.set_yticks([])
-        for spine in self.ax.spines.values():
+                    ax.text(mid_x, mid_y, f' {text} ', ha=ha, va=va, rotation=0,
+                             fontsize=12, color='black', backgroundcolor='white', 
+                             weight='bold', bbox=dict(boxstyle="round,pad=0.3", facecolor='white', alpha=0.9))
+
+                # The worker already determined which side of the rectangle is the width
+                idx = snapshot["roi_width_side_index"]
+                width_coords = coords[idx:idx + 2]
+                height_coords = coords[1 - idx:3 - idx]
+
+                # Draw width and height measurements
+                draw_dimension(width_coords, f'{snapshot["roi_width_m"]:.2f} m')
+                draw_dimension(height_coords, f'{snapshot["roi_height_m"]:.2f} m')
+
+        # Set up the map area
+        ax.set_xticks([])
+        ax.set_yticks([])
+        for spine in ax.spines.values():
             spine.set_visible(False)
+        ax.axis('equal')
+        
+        # Create information area below the map
+        ax_info.set_xticks([])
+        ax_info.set_yticks([])
+        for spine in ax_info.spines.values():
+            spine.set_visible(False)
+        ax_info.set_facecolor('white')
+        fig.patch.set_facecolor('white')  # Ensure figure background is white
+        
+        # Calculate area values for display
+        unit_text = "ha" if snapshot["use_hectares"] else "m²"
+        tiff_area_display = snapshot["tiff_area_m2"] / 10000 if snapshot["use_hectares"] else snapshot["tiff_area_m2"]
+        roi_area_display = snapshot["roi_area_m2"] / 10000 if snapshot["use_hectares"] else snapshot["roi_area_m2"]
+        
+        # Compose the info line with colored values using multiple text elements
+        tiff_label = f"TIFF Area: "
+        tiff_value = f"{tiff_area_display:.4f} {unit_text}"
+        roi_label = f" | ROI Area: "
+        roi_value = f"{roi_area_display:.4f} {unit_text}"
+
+        # Measure the text widths straight from the renderer, without adding dummy artists or drawing the figure
+        font = FontProperties(size=16, weight='bold')
+        renderer = canvas.get_renderer()
+        def text_width(s):
+            return renderer.get_text_width_height_descent(s, font, ismath=False)[0] / fig.dpi / fig.get_figwidth()
+        width = text_width(tiff_label + tiff_value + roi_label + roi_value)
+        x = 0.5 - width / 2
+        y = 0.5
+        tw1 = text_width(tiff_label)
+        tw2 = text_width(tiff_value)
+        tw3 = text_width(roi_label)
+        tw4 = text_width(roi_value)
+        ax_info.text(x, y, tiff_label, fontsize=16, weight='bold', ha='left', va='center', color='black', zorder=2, transform=ax_info.transAxes)
+        x += tw1
+        ax_info.text(x, y, tiff_value, fontsize=16, weight='bold', ha='left', va='center', color='red', zorder=2, transform=ax_info.transAxes)
+        x += tw2
+        ax_info.text(x, y, roi_label, fontsize=16, weight='bold', ha='left', va='center', color='black', zorder=2, transform=ax_info.transAxes)
+        x += tw3
+        ax_info.text(x, y, roi_value, fontsize=16, weight='bold', ha='left', va='center', color='#4FC3F7', zorder=2, transform=ax_info.transAxes)
+
+        fig.tight_layout()
+        
+        # PNG is lossless, so the fastest zlib level only trades some file size for a much quicker encode
+        fig.savefig(file_path, dpi=snapshot["export_dpi"], bbox_inches='tight', 
+                   facecolor='white', edgecolor='none', transparent=False, pil_kwargs={"compress_level": 1, "optimize": False})
 
-        tiff_path = self.tiff_path_edit.text()
-        shp_path = self.shp_path_edit.text()
-
-        if not tiff_path or not shp_path:
+    def update_visualization(self):
+        # Remove the previous measurement lines and labels. The axes set-up, the raster image and
+        # the polygon overlays are kept and updated in place.
+        for artist in [*self.ax.lines, *self.ax.texts]:
+            artist.remove()
+
+        # Everything drawn below comes from the worker's results, so nothing is read or reprojected again here.
+        # Whether there is anything to draw depends on those results, not on the current contents of the path fields.
+        if not self.result_tiff_path or not self.result_shp_path or self.preview_image is None or self.roi_metric is None:
+            for artist in (self.preview_artist, self.tiff_overlay, self.roi_overlay):
+                if artist is not None:
+                    artist.set_visible(False)
             self.ax.text(0.5, 0.5, "Load data to see visualization", ha='center', va='center', transform=self.ax.transAxes)
             self.canvas.draw()
             return
 
+        import shapely
+
         try:
-            # Display downsampled TIFF
-            with rasterio.open(tiff_path) as src:
-                scale = 30
-                out_shape = (src.count, int(src.height//scale), int(src.width//scale))
-                image = src.read(out_shape=out_shape, resampling=Resampling.bilinear)
-                transform = src.transform * src.transform.scale((src.width / image.shape[-1]), (src.height / image.shape[-2]))
-                rasterio.plot.show(image, transform=transform, ax=self.ax)
-            
-            # Plot TIFF polygon
-            with rasterio.open(tiff_path) as src:
-                alpha = src.read(4)
-                mask = alpha > 0
-                results = ({'geometry': shape(geom)} for geom, val in shapes(alpha, mask=mask, transform=src.transform) if val > 0)
-                geoms = list(results)
-                gdf = gpd.GeoDataFrame(geometry=[g["geometry"] for g in geoms], crs=src.crs).dissolve()
-                
-                # Use dynamic coordinate system selection instead of hardcoded EPSG:32633
-                optimal_crs = get_optimal_utm_crs(gdf)
-                gdf_optimal = gdf.to_crs(optimal_crs)
-                gdf_optimal.plot(ax=self.ax, facecolor='red', edgecolor='red', alpha=0.3, linewidth=2)
-            
-            # Plot ROI polygon and its bounding box
-            roi = gpd.read_file(shp_path)
+            # Display the downsampled TIFF the worker read, reusing the existing image artist if there is one
+            if self.preview_artist is None:
+                self.preview_artist = show_raster(self.ax, self.preview_image, self.preview_transform)
+            else:
+                data, extent = raster_display_data(self.preview_image, self.preview_transform)
+                self.preview_artist.set_data(data)
+                self.preview_artist.set_extent(extent)
+                self.preview_artist.set_visible(True)
             
-            # Use the same optimal coordinate system for ROI to ensure proper alignment
-            roi_optimal = roi.to_crs(optimal_crs)
-            roi_optimal.plot(ax=self.ax, facecolor='#4FC3F7', edgecolor='#29B6F6', alpha=0.6, linewidth=2)  # Less transparent blue for better visibility
+            # Plot the TIFF footprint the worker already extracted, and the ROI polygons from the worker's reprojected ROI
+            tiff_paths = geometry_paths(self.tiff_gdf_optimal)
+            roi_paths = geometry_paths(self.roi_metric)
+            if self.tiff_overlay is None:
+                self.tiff_overlay = PathCollection(tiff_paths, facecolor='red', edgecolor='red', alpha=0.3, linewidth=2)
+                self.roi_overlay = PathCollection(roi_paths, facecolor='#4FC3F7', edgecolor='#29B6F6', alpha=0.6, linewidth=2)  # Less transparent blue for better visibility
+                self.ax.add_collection(self.tiff_overlay)
+                self.ax.add_collection(self.roi_overlay)
+            else:
+                self.tiff_overlay.set_paths(tiff_paths)
+                self.roi_overlay.set_paths(roi_paths)
+                self.tiff_overlay.set_visible(True)
+                self.roi_overlay.set_visible(True)
+                # Recompute the data limits from the updated artists, dropping the previous result's extents.
+                # Depending on the Matplotlib version relim() may skip collections, so their bounds are added explicitly.
+                self.ax.relim()
+                for gdf in (self.tiff_gdf_optimal, self.roi_metric):
+                    minx, miny, maxx, maxy = gdf.total_bounds
+                    self.ax.update_datalim([(minx, miny), (maxx, maxy)])
+                self.ax.autoscale_view()
             
             # Draw the minimum rotated rectangle and dimension lines
             if self.roi_rotated_rect:
@@ -586,11 +728,11 @@ class UAVAreaCalculator(QMainWindow):
                 self.ax.plot(*self.roi_rotated_rect.exterior.xy, color='black', linestyle='--', linewidth=2)  # Black dashed line for white background
                 
                 # Get the coordinates of the rectangle's corners
-                x, y = self.roi_rotated_rect.exterior.coords.xy
+                coords = shapely.get_coordinates(self.roi_rotated_rect)
                 
                 # Function to draw a dimension line with non-rotated text
                 def draw_dimension(coords, text):
-                    x1, y1, x2, y2 = coords
+                    (x1, y1), (x2, y2) = coords
                     mid_x = (x1 + x2) / 2
                     mid_y = (y1 + y2) / 2
                     self.ax.plot([x1, x2], [y1, y2], color='black', linestyle='-', linewidth=2)  # Black lines for white background
@@ -605,24 +747,18 @@ class UAVAreaCalculator(QMainWindow):
                                  fontsize=12, color='black', backgroundcolor='white', 
                                  weight='bold', bbox=dict(boxstyle="round,pad=0.3", facecolor='white', alpha=0.9))
 
-                # Determine which side is width vs height
-                side1_len = np.sqrt((x[1] - x[0])**2 + (y[1] - y[0])**2)
-                
-                if np.isclose(side1_len, self.roi_width_m):
-                    width_coords = (x[0], y[0], x[1], y[1])
-                    height_coords = (x[1], y[1], x[2], y[2])
-                else:
-                    width_coords = (x[1], y[1], x[2], y[2])
-                    height_coords = (x[0], y[0], x[1], y[1])
+                # The worker already determined which side of the rectangle is the width
+                idx = self.roi_width_side_index
+                width_coords = coords[idx:idx + 2]
+                height_coords = coords[1 - idx:3 - idx]
 
                 # Draw width and height
                 draw_dimension(width_coords, f'{self.roi_width_m:.2f} m')
                 draw_dimension(height_coords, f'{self.roi_height_m:.2f} m')
 
 
-            plt.axis('equal')
-            self.fig.tight_layout()
-            self.canvas.draw()
+            self.ax.set_aspect('equal', adjustable='datalim')
+            self.canvas.draw_idle()
             
         except Exception as e:
             print(f"Error updating visualization: {e}") 
@@ -631,14 +767,15 @@ class ExportWorker(QObject):
     finished = Signal(str)
     error = Signal(str)
 
-    def __init__(self, file_path, create_export_func):
+    def __init__(self, file_path, snapshot, create_export_func):
         super().__init__()
         self.file_path = file_path
+        self.snapshot = snapshot
         self.create_export_func = create_export_func
 
     def run(self):
         try:
-            self.create_export_func(self.file_path)
+            self.create_export_func(self.file_path, self.snapshot)
             self.finished.emit(self.file_path)
         except Exception as e:
-            self.error.emit(str(e)) 
\ No newline at end of file
+            self.error.emit(str(e)) 
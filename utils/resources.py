@@ -2,34 +2,37 @@ import os
 import sys
 from PySide6.QtGui import QIcon, QFontDatabase
 
+# Correctly determine the base directory even when run from different locations; computed once at import
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_ICON_PATH = os.path.join(_BASE_DIR, 'assets', 'icons', 'icon.icns' if sys.platform == "darwin" else 'icon.png')
+_FONTS_DIR = os.path.join(_BASE_DIR, 'assets', 'fonts')
+
+_fonts_loaded = False
+
 def get_app_icon():
     """Gets the application icon QIcon object, preferring .icns on macOS."""
     try:
-        # Correctly determine base_dir even when run from different locations
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        if sys.platform == "darwin":
-            icon_path = os.path.join(base_dir, 'assets', 'icons', 'icon.icns')
-        else:
-            icon_path = os.path.join(base_dir, 'assets', 'icons', 'icon.png')
-            
-        if os.path.exists(icon_path):
-            return QIcon(icon_path)
+        if os.path.exists(_ICON_PATH):
+            return QIcon(_ICON_PATH)
     except Exception as e:
         print(f"Warning: Could not load application icon: {e}")
     return None
 
 def load_custom_fonts():
-    """Loads custom .ttf fonts from the assets/fonts directory."""
+    """Loads custom .ttf fonts from the assets/fonts directory. Repeated calls do nothing."""
+    global _fonts_loaded
+    if _fonts_loaded:
+        return
     try:
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        fonts_dir = os.path.join(base_dir, 'assets', 'fonts')
-        if not os.path.exists(fonts_dir):
+        if not os.path.exists(_FONTS_DIR):
             print("Warning: Fonts directory not found.")
             return
 
-        for font_file in os.listdir(fonts_dir):
-            if font_file.lower().endswith('.ttf'):
-                font_path = os.path.join(fonts_dir, font_file)
-                QFontDatabase.addApplicationFont(font_path)
+        # scandir yields full paths and the entry type directly, without a separate listdir, path join or stat per file
+        with os.scandir(_FONTS_DIR) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.lower().endswith('.ttf'):
+                    QFontDatabase.addApplicationFont(entry.path)
+        _fonts_loaded = True
     except Exception as e:
-        print(f"Warning: Could not load custom fonts: {e}") 
\ No newline at end of file
+        print(f"Warning: Could not load custom fonts: {e}")